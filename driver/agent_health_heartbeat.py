@@ -6,9 +6,8 @@ import logging
 import queue
 
 from apscheduler.schedulers.background import BackgroundScheduler
-from requests import Session
 
-from driver.compute_server_client import AgentHealthData, ComputeServerClient
+from driver.compute_server_client import AgentHealthData, get_compute_server_client
 from driver.driver_config import DriverConfig
 
 error_queue_global = queue.Queue()  # thread safe queue
@@ -75,9 +74,7 @@ def send_heartbeat(
         "agent_version": agent_version,
         "errors": construct_error_list_and_clear(),
     }
-    compute_server_client = ComputeServerClient(
-        config.server_url, Session(), config.api_key
-    )
+    compute_server_client = get_compute_server_client(config.server_url, config.api_key)
     compute_server_client.post_agent_health_heartbeat(data)
 
 
@@ -7,6 +7,8 @@ from mypy_boto3_cloudwatch.client import CloudWatchClient
 from driver.aws.wrapper import AwsWrapper
 from driver.exceptions import CloudWatchException
 
+MAX_QUERIES_PER_REQUEST = 500
+
 
 def cloudwatch_collector(driver_conf: Dict[str, Any]) -> Dict[str, Any]:
     preparations = _prepare_for_cloudwatch(driver_conf)
@@ -94,26 +96,38 @@ def _get_metrics_from_cloudwatch(
                     },
                 },
             )
-    try:
-        response = client.get_metric_data(
-            MetricDataQueries=queries,
-            StartTime=now_time - timedelta(seconds=query_window_in_seconds),
-            EndTime=now_time,
+    # GetMetricData accepts at most 500 queries per request and pages large results
+    for start in range(0, len(queries), MAX_QUERIES_PER_REQUEST):
+        request: Dict[str, Any] = {
+            "MetricDataQueries": queries[start : start + MAX_QUERIES_PER_REQUEST],
+            "StartTime": now_time - timedelta(seconds=query_window_in_seconds),
+            "EndTime": now_time,
             # Returns newest data first
-            ScanBy="TimestampDescending",
-        )
-    except Exception as ex:
-        msg = f"Failed to collect metrics from cloudwatch, metrics list={metrics_to_retrieve}"
-        raise CloudWatchException(msg, ex) from ex
+            "ScanBy": "TimestampDescending",
+        }
+        while True:
+            try:
+                response = client.get_metric_data(**request)
+            except Exception as ex:
+                msg = f"Failed to collect metrics from cloudwatch, metrics list={metrics_to_retrieve}"
+                raise CloudWatchException(msg, ex) from ex
+
+            for result in response["MetricDataResults"]:
+                # We need to get the metric name here. Since name was not included in the
+                # response, in queries we use "id_" + metric_name as the metric Id so that in
+                # the response we can extract the name by discarding the first three chars.
+                # Also, we get the newest data here, which comes with the first page.
+                metric_name = result["Id"][3:]
+                if result["Values"] and metric_name not in ret:
+                    ret[metric_name] = result["Values"][0]
+
+            next_token = response.get("NextToken")
+            if not next_token:
+                break
+            request["NextToken"] = next_token
 
-    for result in response["MetricDataResults"]:
-        metric_name = result["Id"][3:]
-        if result["Values"]:
-            # We need to get the metric name here. Since name was not included in the response,
-            # in queries we use "id_" + metric_name as the metric Id so that in the response
-            # we can extract the name by discarding the first three chars.
-            # Also, we get the newest data here
-            ret[metric_name] = result["Values"][0]
-        else:
+    for query in queries:
+        metric_name = query["Id"][3:]
+        if metric_name not in ret:
             logging.warning("Unable to collect metric %s from cloudwatch", metric_name)
     return ret
@@ -83,7 +83,7 @@ def get_db_cluster_identifier(db_instance_identifier: str, client: RDSClient) ->
     )
 
 
-def get_db_port(db_instance_identifier: str, client: RDSClient) -> str:
+def get_db_port(db_instance_identifier: str, client: RDSClient) -> int:
     """
     Ensures that we can connect to the target AWS RDS instance by calling describe_db_instances.
     Returns:
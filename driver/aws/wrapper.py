@@ -1,4 +1,5 @@
 """Library for performing aws methods"""
+from functools import lru_cache
 from typing import List, Optional
 import boto3
 import botocore
@@ -32,14 +33,16 @@ class AwsWrapper:
     """
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def rds_client(region_name: str) -> RDSClient:
         """
-        Wrapper for RDS client
+        Wrapper for RDS client, clients are thread safe and shared per region
         """
         return boto3.client("rds", region_name=region_name)
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def cloudwatch_client(region_name: str) -> CloudWatchClient:
-        """Return a cloudwatch client"""
+        """Return a cloudwatch client, clients are thread safe and shared per region"""
 
         return boto3.client("cloudwatch", region_name=region_name)
@@ -1,7 +1,8 @@
 """Defines the compute server client that interacts with the server with http requests"""
 
+import threading
 import zlib
-from typing import List, Dict, Any, TypedDict, Set
+from typing import List, Dict, Any, TypedDict, Set, Tuple
 from http import HTTPStatus
 from requests import Session
 import simplejson as json
@@ -264,3 +265,32 @@ class ComputeServerClient:
         except Exception as ex:
             msg = "Failed to post the agent health heartbeat to the server"
             raise ComputeServerClientException(msg, ex) from ex
+
+
+class _ThreadLocalClients(threading.local):
+    """Compute server clients of the current thread.
+
+    requests does not guarantee a Session is thread-safe, so each thread has its own.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.clients: Dict[Tuple[str, str], ComputeServerClient] = {}
+
+
+_thread_local = _ThreadLocalClients()
+
+
+def get_compute_server_client(server_url: str, api_key: str) -> ComputeServerClient:
+    """Get the compute server client for a server and api key.
+
+    Clients are shared per (server_url, api_key) within a thread, so that repeated
+    pipeline runs on a scheduler worker thread reuse the connection pool of one request
+    session, while jobs running concurrently never use the same session.
+    """
+    clients = _thread_local.clients
+    client = clients.get((server_url, api_key))
+    if client is None:
+        client = ComputeServerClient(server_url, Session(), api_key)
+        clients[(server_url, api_key)] = client
+    return client
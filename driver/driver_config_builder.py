@@ -3,21 +3,35 @@ Defines the DriverConfigBuilder to build the driver configuraton for on-prem dep
 It fetches the necessary information to run the driver pipeline from the local file and server.
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, NamedTuple, List, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, NamedTuple, List, Optional, Tuple
+import copy
 import json
 import logging
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from pydantic import (
     BaseModel,
     StrictBool,
     StrictInt,
     StrictStr,
-    validator,
     ValidationError,
+    validator,
 )
+from pydantic.fields import ModelField
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from driver.aws.rds import (
     get_db_version,
     get_db_port,
@@ -29,6 +43,121 @@ from driver.aws.rds import (
 from driver.aws.wrapper import AwsWrapper
 from driver.driver_config import DriverConfig
 from driver.exceptions import DriverConfigException
+from driver.metric_source_utils import METRIC_SOURCE_COLLECTOR
+
+
+# Lower bounds (in seconds) for the monitor intervals, shared with the command line
+MIN_MONITOR_INTERVAL = 60
+MIN_TABLE_LEVEL_MONITOR_INTERVAL = 300
+MIN_LONG_RUNNING_QUERY_MONITOR_INTERVAL = 60
+MIN_QUERY_MONITOR_INTERVAL = 300
+MIN_SCHEMA_MONITOR_INTERVAL = 300
+MIN_AGENT_HEALTH_REPORT_INTERVAL = 1
+
+# Lower bounds of the numeric options read from the config file
+_FILE_OPTION_MINIMUMS: Dict[str, int] = {
+    "monitor_interval": MIN_MONITOR_INTERVAL,
+    "num_table_to_collect_stats": 0,
+    "table_level_monitor_interval": MIN_TABLE_LEVEL_MONITOR_INTERVAL,
+    "num_index_to_collect_stats": 0,
+    "long_running_query_monitor_interval": MIN_LONG_RUNNING_QUERY_MONITOR_INTERVAL,
+    "lr_query_latency_threshold_min": 1,
+    "query_monitor_interval": MIN_QUERY_MONITOR_INTERVAL,
+    "num_query_to_collect": 0,
+    "schema_monitor_interval": MIN_SCHEMA_MONITOR_INTERVAL,
+    "agent_health_report_interval": MIN_AGENT_HEALTH_REPORT_INTERVAL,
+}
+
+_CLOUDWATCH_METRICS_DIR = os.path.join(
+    os.path.dirname(__file__), "config", "cloudwatch_metrics"
+)
+_CLOUDWATCH_METRICS_CLUSTER_DIR = os.path.join(
+    os.path.dirname(__file__), "config", "cloudwatch_metrics_cluster"
+)
+_CLOUDWATCH_METRICS_FILE_TEMPLATE = os.path.join(
+    _CLOUDWATCH_METRICS_DIR, "rds_{}-{}.json"
+)
+_CLOUDWATCH_METRICS_CLUSTER_FILE_TEMPLATE = os.path.join(
+    _CLOUDWATCH_METRICS_CLUSTER_DIR, "rds_{}-{}.json"
+)
+
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
+def _is_true(value: Optional[str]) -> bool:
+    """Parse a boolean command line flag, treating a missing flag as false."""
+    return isinstance(value, str) and value.lower() in _TRUE_VALUES
+
+
+@lru_cache(maxsize=16)
+def _load_yaml_file(config_path: str, _mtime_ns: int, _size: int) -> Any:
+    """Parse a YAML file, cached per path and file version.
+
+    _mtime_ns and _size are only part of the cache key, so that an edited file is parsed
+    again.
+    """
+    # the yaml reader detects the encoding of byte streams itself
+    with open(config_path, "rb") as config_file:
+        return yaml.load(config_file, Loader=_YamlLoader)
+
+
+def _read_yaml_file(config_path: str) -> Any:
+    """Return a private copy of the parsed content of a YAML file."""
+    stat = os.stat(config_path)
+    data = _load_yaml_file(os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(data)
+
+
+@lru_cache(maxsize=32)
+def _load_metric_names(file_path: str) -> Tuple[str, ...]:
+    """Load the metric names from a cloudwatch metrics file.
+
+    The result is cached per file path since the metrics files are shipped with the agent
+    and do not change while it is running.
+    """
+    with open(file_path, "rb") as metrics_file:
+        data = metrics_file.read()
+    metrics = orjson.loads(data) if orjson is not None else json.loads(data)
+    return tuple(map(itemgetter("name"), metrics))
+
+
+def _canonicalize_aurora_postgresql_version(db_version: str) -> str:
+    """Keep the major version only, e.g. 12_6 -> 12"""
+    return db_version.split("_", 1)[0]
+
+
+def _canonicalize_aurora_mysql_version(db_version: str) -> str:
+    """Keep the mysql release and major version, e.g. 5_7_mysql_aurora_2_10_1 -> 5_7"""
+    release, major = db_version.split("_", 2)[:2]
+    return f"{release}_{major}"
+
+
+def _canonicalize_postgres_version(db_version: str) -> str:
+    """Drop the minor version except for 9_6, e.g. 13_4 -> 13, 9_6_22 -> 9_6"""
+    if "9_6" in db_version:
+        major, minor, _ = db_version.split("_")
+        return f"{major}_{minor}"
+    major, _ = db_version.split("_")
+    return major
+
+
+def _canonicalize_mysql_version(db_version: str) -> str:
+    """Drop the minor version if present, e.g. 8_0_28 -> 8_0"""
+    try:
+        release, major, _ = db_version.split("_")
+    except ValueError:
+        release, major = db_version.split("_")
+    return f"{release}_{major}"
+
+
+# Maps the db type to the function that turns the db version into the version used to
+# name the cloudwatch metrics files
+_DB_VERSION_CANONICALIZERS: Dict[str, Callable[[str], str]] = {
+    "aurora_postgresql": _canonicalize_aurora_postgresql_version,
+    "aurora_mysql": _canonicalize_aurora_mysql_version,
+    "postgres": _canonicalize_postgres_version,
+    "mysql": _canonicalize_mysql_version,
+}
 
 
 class BaseDriverConfigBuilder(ABC):
@@ -62,111 +191,27 @@ class PartialConfigFromFile(  # pyre-ignore[13]: pydantic uninitialized variable
     schema_monitor_interval: StrictInt
     agent_health_report_interval: StrictInt
 
-    @validator("table_level_monitor_interval")
-    def check_table_level_monitor_interval(  # pylint: disable=no-self-argument, no-self-use
-        cls, val: int
+    @validator(*_FILE_OPTION_MINIMUMS)
+    def check_minimum(  # pylint: disable=no-self-argument, no-self-use
+        cls, val: int, field: ModelField
     ) -> int:
-        """Validate that table_level_monitor_interval is greater than 5 minutes"""
-        if val < 300:
+        """Validate that a numeric option is not below its lower bound"""
+        minimum = _FILE_OPTION_MINIMUMS[field.name]
+        if val < minimum:
             raise ValueError(
-                "Invalid driver option table_level_monitor_interval, value >= 300"
+                f"Invalid driver option {field.name}, value >= {minimum}"
                 f" is expected, but {val} is found"
             )
         return val
 
-    @validator("monitor_interval")
-    def check_monitor_interval(  # pylint: disable=no-self-argument, no-self-use
-        cls, val: int
-    ) -> int:
-        """Validate that monitor_interval is positive and at least 60 seconds."""
-        if val < 60:
-            raise ValueError(
-                "Invalid driver option monitor_interval, positive value"
-                f" is expected, but {val} is found"
-            )
-        return val
-
-    @validator("long_running_query_monitor_interval")
-    def check_long_running_query_monitor_interval(  # pylint: disable=no-self-argument, no-self-use
-        cls, val: int
-    ) -> int:
-        """Validate that long_running_query_monitor_interval is positive and at least 60 seconds."""
-        if val < 60:
-            raise ValueError(
-                "Invalid driver option long_running_query_monitor_interval, positive value >= 60"
-                f" is expected, but {val} is found"
-            )
-        return val
-
-    @validator("lr_query_latency_threshold_min")
-    def check_lr_query_latency_threshold_min(  # pylint: disable=no-self-argument, no-self-use
-        cls, val: int
-    ) -> int:
-        """Validate that lr_query_latency_threshold_min is positive and at least 60 seconds."""
-        if val < 1:
-            raise ValueError(
-                "Invalid driver option lr_query_latency_threshold_min, positive value >= 1"
-                f" is expected, but {val} is found"
-            )
-        return val
-
-    @validator("num_table_to_collect_stats")
-    def check_num_table_to_collect_stats(  # pylint: disable=no-self-argument, no-self-use
-        cls, val: int
-    ) -> int:
-        """Validate that num_table_to_collect_stats is not negative"""
-        if val < 0:
-            raise ValueError(
-                "Invalid driver option num_table_to_collect_stats, non-negative value"
-                f" is expected, but {val} is found"
-            )
-        return val
-
-    @validator("num_index_to_collect_stats")
-    def check_num_index_to_collect_stats(  # pylint: disable=no-self-argument, no-self-use
-        cls, val: int
-    ) -> int:
-        """Validate that num_index_to_collect_stats is not negative"""
-        if val < 0:
-            raise ValueError(
-                "Invalid driver option num_index_to_collect_stats, non-negative value"
-                f" is expected, but {val} is found"
-            )
-        return val
-
-    @validator("query_monitor_interval")
-    # pylint: disable=no-self-argument, no-self-use
-    def check_query_monitor_interval(cls, val: int) -> int:
-        """Validate that query_monitor_interval is greater than 5 minutes"""
-        if val < 300:
-            raise ValueError(
-                "Invalid driver option query_monitor_interval, value >= 300"
-                f" is expected, but {val} is found"
-            )
-        return val
-
-    @validator("num_query_to_collect")
-    # pylint: disable=no-self-argument, no-self-use
-    def check_num_query_to_collect(cls, val: int) -> int:
-        """Validate that num_query_to_collect is not negative"""
-        if val < 0:
-            raise ValueError(
-                "Invalid driver option num_query_to_collect, non-negative value"
-                f" is expected, but {val} is found"
-            )
-        return val
-
-    @validator("schema_monitor_interval")
-    def check_schema_monitor_interval(  # pylint: disable=no-self-argument, no-self-use
-        cls, val: int
-    ) -> int:
-        """Validate that schema_monitor_interval is greater than 5 minutes"""
-        if val < 300:
-            raise ValueError(
-                "Invalid driver option schema_monitor_interval, value >= 300"
-                f" is expected, but {val} is found"
-            )
-        return val
+    @validator("metric_source", each_item=True)
+    def check_metric_source(  # pylint: disable=no-self-argument, no-self-use
+        cls, value: str
+    ) -> str:
+        """Reject unknown sources here instead of on every collection cycle"""
+        if value not in METRIC_SOURCE_COLLECTOR:
+            raise ValueError(f"Unsupported metric source: {value}")
+        return value
 
 
 class Overrides(NamedTuple):
@@ -174,28 +219,27 @@ class Overrides(NamedTuple):
     Runtime overrides for configurations in files, useful for when running in container
     """
 
-    monitor_interval: int
-    server_url: str
-    num_table_to_collect_stats: int
-    table_level_monitor_interval: int
-    num_index_to_collect_stats: int
-    long_running_query_monitor_interval: int
-    lr_query_latency_threshold_min: int
-    query_monitor_interval: int
-    num_query_to_collect: int
-    schema_monitor_interval: int
-    agent_health_report_interval: int
+    monitor_interval: Optional[int]
+    server_url: Optional[str]
+    num_table_to_collect_stats: Optional[int]
+    table_level_monitor_interval: Optional[int]
+    num_index_to_collect_stats: Optional[int]
+    long_running_query_monitor_interval: Optional[int]
+    lr_query_latency_threshold_min: Optional[int]
+    query_monitor_interval: Optional[int]
+    num_query_to_collect: Optional[int]
+    schema_monitor_interval: Optional[int]
+    agent_health_report_interval: Optional[int]
 
 
-class PartialConfigFromEnvironment(  # pyre-ignore[13]: pydantic uninitialized variables
-    BaseModel
-):
+class PartialConfigFromEnvironment(NamedTuple):
     """Driver options fetched from RDS for agent deployment.
 
     Such options are part of the complete driver options (defined in DriverConfig).
+    They come from our own environment and are not validated.
     """
 
-    db_name: Optional[StrictStr]
+    db_name: Optional[str]
 
 
 class PartialConfigFromCommandline(  # pyre-ignore[13]: pydantic uninitialized variables
@@ -226,31 +270,29 @@ class PartialConfigFromCommandline(  # pyre-ignore[13]: pydantic uninitialized v
     disable_schema_monitoring: StrictBool = False
 
 
-class PartialConfigFromRDS(  # pyre-ignore[13]: pydantic uninitialized variables
-    BaseModel
-):
+class PartialConfigFromRDS(NamedTuple):
     """Driver options fetched from RDS for agent deployment.
 
     Such options are part of the complete driver options (defined in DriverConfig).
+    They are returned by the RDS API and are not validated.
     """
 
-    db_cluster_identifier: StrictStr
-    db_host: StrictStr
-    db_port: StrictInt
-    db_version: StrictStr
-    db_type: StrictStr
+    db_cluster_identifier: str
+    db_host: str
+    db_port: int
+    db_version: str
+    db_type: str
     db_non_default_parameters: List[str]
 
 
-class PartialConfigFromCloudwatchMetrics(  # pyre-ignore[13]: uninitialized variables
-    BaseModel
-):
+class PartialConfigFromCloudwatchMetrics(NamedTuple):
     """Driver options fetched from RDS for agent deployment.
 
     Such options are part of the complete driver options (defined in DriverConfig).
+    They are read from the metrics files shipped with the agent and are not validated.
     """
 
-    metrics_to_retrieve_from_source: Dict[StrictStr, List[StrictStr]]
+    metrics_to_retrieve_from_source: Dict[str, List[str]]
 
 
 class DriverConfigBuilder(BaseDriverConfigBuilder):
@@ -263,35 +305,34 @@ class DriverConfigBuilder(BaseDriverConfigBuilder):
 
     def from_file(self, config_path: str) -> BaseDriverConfigBuilder:
         """build config options from config file"""
-        with open(config_path, "r", encoding="utf-8") as config_file:
-            data = yaml.safe_load(config_file)
-            if not isinstance(data, dict):
-                raise ValueError("Invalid data in the driver configuration YAML file")
-
-            try:
-                partial_config_from_file: PartialConfigFromFile = PartialConfigFromFile(
-                    **data
-                )
-            except ValidationError as ex:
-                msg = (
-                    "Invalid driver configuration for On-Prem deployment: "
-                    "the driver option from file is missing or invalid"
-                )
-                raise DriverConfigException(msg, ex) from ex
-            self.config.update(partial_config_from_file)
+        data = _read_yaml_file(config_path)
+        if not isinstance(data, dict):
+            raise ValueError("Invalid data in the driver configuration YAML file")
+
+        try:
+            partial_config_from_file: PartialConfigFromFile = PartialConfigFromFile(
+                **data
+            )
+        except ValidationError as ex:
+            msg = (
+                "Invalid driver configuration for On-Prem deployment: "
+                "the driver option from file is missing or invalid"
+            )
+            raise DriverConfigException(msg, ex) from ex
+        self.config.update(partial_config_from_file.__dict__)
         return self
 
     def from_command_line(self, args) -> BaseDriverConfigBuilder:
         """build config options from command line arguments that aren't overriding other builders"""
         try:
-            enable_aws_iam_auth = bool(args.enable_aws_iam_auth.lower() == "true")
+            enable_aws_iam_auth = _is_true(args.enable_aws_iam_auth)
             db_password = args.db_password
             if db_password is None and enable_aws_iam_auth:
                 db_password = ""
 
             from_cli = PartialConfigFromCommandline(
                 aws_region=args.aws_region,
-                enable_s3=args.enable_s3.lower() == "true",
+                enable_s3=_is_true(args.enable_s3),
                 s3_bucket_name=args.s3_bucket_name,
                 db_identifier=args.db_identifier,
                 db_user=args.db_username,
@@ -299,15 +340,13 @@ class DriverConfigBuilder(BaseDriverConfigBuilder):
                 api_key=args.api_key,
                 db_key=args.db_key,
                 organization_id=args.organization_id,
-                disable_table_level_stats=args.disable_table_level_stats.lower()
-                == "true",
-                disable_index_stats=args.disable_index_stats.lower() == "true",
-                disable_long_running_query_monitoring=\
-                    args.disable_long_running_query_monitoring.lower() == "true",
-                disable_query_monitoring=args.disable_query_monitoring.lower()
-                == "true",
-                disable_schema_monitoring=args.disable_schema_monitoring.lower()
-                == "true",
+                disable_table_level_stats=_is_true(args.disable_table_level_stats),
+                disable_index_stats=_is_true(args.disable_index_stats),
+                disable_long_running_query_monitoring=_is_true(
+                    args.disable_long_running_query_monitoring
+                ),
+                disable_query_monitoring=_is_true(args.disable_query_monitoring),
+                disable_schema_monitoring=_is_true(args.disable_schema_monitoring),
                 enable_aws_iam_auth=enable_aws_iam_auth,
             )
         except ValidationError as ex:
@@ -317,7 +356,7 @@ class DriverConfigBuilder(BaseDriverConfigBuilder):
             )
             raise DriverConfigException(msg, ex) from ex
 
-        self.config.update(from_cli)
+        self.config.update(from_cli.__dict__)
         return self
 
     def from_env_vars(self):
@@ -334,50 +373,31 @@ class DriverConfigBuilder(BaseDriverConfigBuilder):
                 logging.warning(msg)
                 db_name = None
 
-        config_from_env = {"db_name": db_name}
-
-        try:
-            partial_config_from_env: PartialConfigFromEnvironment = (
-                PartialConfigFromEnvironment(**config_from_env)
-            )
-        except ValidationError as ex:
-            msg = "Invalid driver config the driver option from env vars is missing or invalid"
-            raise DriverConfigException(msg, ex) from ex
+        partial_config_from_env = PartialConfigFromEnvironment(db_name=db_name)
 
-        self.config.update(partial_config_from_env)
+        self.config.update(partial_config_from_env._asdict())
         return self
 
     def from_rds(self, db_instance_identifier) -> BaseDriverConfigBuilder:
         """build config options from rds description of database"""
-        config_from_rds = {
-            "db_cluster_identifier": get_db_cluster_identifier(
+        partial_config_from_rds = PartialConfigFromRDS(
+            db_cluster_identifier=get_db_cluster_identifier(
                 db_instance_identifier, self.rds_client
             ),
-            "db_host": get_db_hostname(db_instance_identifier, self.rds_client),
-            "db_port": get_db_port(db_instance_identifier, self.rds_client),
-            "db_version": get_db_version(db_instance_identifier, self.rds_client),
-            "db_type": get_db_type(db_instance_identifier, self.rds_client),
-            "db_non_default_parameters": get_db_non_default_parameters(
+            db_host=get_db_hostname(db_instance_identifier, self.rds_client),
+            db_port=get_db_port(db_instance_identifier, self.rds_client),
+            db_version=get_db_version(db_instance_identifier, self.rds_client),
+            db_type=get_db_type(db_instance_identifier, self.rds_client),
+            db_non_default_parameters=get_db_non_default_parameters(
                 db_instance_identifier, self.rds_client
             ),
-        }
-
-        try:
-            partial_config_from_rds: PartialConfigFromRDS = PartialConfigFromRDS(
-                **config_from_rds
-            )
-        except ValidationError as ex:
-            msg = (
-                "Invalid driver configuration for On-Prem deployment: "
-                "the driver option from rds is missing or invalid"
-            )
-            raise DriverConfigException(msg, ex) from ex
+        )
 
         self.has_determined_db_type = True
-        self.config.update(partial_config_from_rds)
+        self.config.update(partial_config_from_rds._asdict())
         return self
 
-    def _get_cloudwatch_metrics_file(self, db_instance_identifier):
+    def _get_cloudwatch_metrics_file(self):
         """
         For aurora mysql 5.6:
           db_version = 5_6_mysql_aurora_1_22_2
@@ -389,73 +409,52 @@ class DriverConfigBuilder(BaseDriverConfigBuilder):
           db_version = 10_x / 11_x / 12_x
           db_type = aurora_postgresql
         """
-        db_version = get_db_version(db_instance_identifier, self.rds_client)
-        db_type = get_db_type(db_instance_identifier, self.rds_client)
-
-        if "aurora" in db_type:
-            db_version_breakdown = db_version.split("_")
-            if db_type == "aurora_postgresql":
-                db_version = db_version_breakdown[0]
-            else:
-                db_version = f"{db_version_breakdown[0]}_{db_version_breakdown[1]}"
-        else:
-            if "postgres" in db_type:
-                # drop minor version except for 9_6
-                if "9_6" in db_version:
-                    major, minor, _ = db_version.split("_")
-                    db_version = f"{major}_{minor}"
-                else:
-                    db_version, _ = db_version.split("_")
-            if "mysql" in db_type:
-                # drop minor version if present
-                try:
-                    release, major, _ = db_version.split("_")
-                except ValueError:
-                    release, major = db_version.split("_")
-                db_version = f"{release}_{major}"
-
-        cluster_folder_path = "./driver/config/cloudwatch_metrics_cluster"
-        folder_path = "./driver/config/cloudwatch_metrics"
+        if not self.has_determined_db_type:
+            msg = (
+                "Builder must know db type before from_cloudwatch_metrics, "
+                "try running from_rds first"
+            )
+            raise DriverConfigException(msg)
+
+        db_version = self.config["db_version"]
+        db_type = self.config["db_type"]
+
+        try:
+            canonicalize_db_version = _DB_VERSION_CANONICALIZERS[db_type]
+        except KeyError as ex:
+            msg = f"Cloudwatch metrics are not available for db type {db_type}"
+            raise DriverConfigException(msg) from ex
+        db_version = canonicalize_db_version(db_version)
+
         return (
-            f"{cluster_folder_path}/rds_{db_type}-{db_version}.json",
-            f"{folder_path}/rds_{db_type}-{db_version}.json",
+            _CLOUDWATCH_METRICS_CLUSTER_FILE_TEMPLATE.format(db_type, db_version),
+            _CLOUDWATCH_METRICS_FILE_TEMPLATE.format(db_type, db_version),
         )
 
     def from_cloudwatch_metrics(
-        self, db_instance_identifier
+        self, db_instance_identifier  # pylint: disable=unused-argument
     ) -> BaseDriverConfigBuilder:
         """Build config options from cloudwatch metrics configurations"""
-        metric_names = []
-        cluster_file_path, file_path = self._get_cloudwatch_metrics_file(
-            db_instance_identifier
-        )
-        with open(file_path, "r", encoding="utf-8") as metrics_file:
-            metrics = json.load(metrics_file)
-            for metric in metrics:
-                metric_names.append(metric["name"])
-
-        cluster_metric_names = []
-        with open(cluster_file_path, "r", encoding="utf-8") as metrics_file:
-            metrics = json.load(metrics_file)
-            for metric in metrics:
-                cluster_metric_names.append(metric["name"])
-
-        self.config.update(
-            {
-                "metrics_to_retrieve_from_source": {
-                    "cloudwatch": metric_names,
-                    "cloudwatch_cluster": cluster_metric_names,
-                }
+        cluster_file_path, file_path = self._get_cloudwatch_metrics_file()
+        metric_names = list(_load_metric_names(file_path))
+        cluster_metric_names = list(_load_metric_names(cluster_file_path))
+
+        partial_config_from_cloudwatch_metrics = PartialConfigFromCloudwatchMetrics(
+            metrics_to_retrieve_from_source={
+                "cloudwatch": metric_names,
+                "cloudwatch_cluster": cluster_metric_names,
             }
         )
+        self.config.update(partial_config_from_cloudwatch_metrics._asdict())
         return self
 
     def from_overrides(self, overrides) -> BaseDriverConfigBuilder:
         """Override config options supplied from other builder steps"""
-        supplied_overrides = {
-            k: v for k, v in overrides._asdict().items() if v is not None
-        }
-        self.config.update(supplied_overrides)
+        self.config.update(
+            (name, value)
+            for name, value in zip(overrides._fields, overrides)
+            if value is not None
+        )
         return self
 
     def from_placeholder_data(self):
@@ -482,5 +481,12 @@ class DriverConfigBuilder(BaseDriverConfigBuilder):
         Raises:
             DriverConfigException: Invalid driver configuration for on-prem deployment.
         """
-        driver_config: DriverConfig = DriverConfig(**self.config)
+        missing = [name for name in DriverConfig._fields if name not in self.config]
+        if missing:
+            msg = f"Invalid driver configuration: missing options {', '.join(missing)}"
+            raise DriverConfigException(msg)
+        # project onto the config fields, options only used while building are dropped
+        driver_config: DriverConfig = DriverConfig._make(
+            self.config[name] for name in DriverConfig._fields
+        )
         return driver_config
@@ -7,6 +7,7 @@ import argparse
 import datetime
 import logging
 import traceback
+from typing import Callable, List, Tuple
 
 from apscheduler.schedulers.background import BlockingScheduler
 
@@ -16,7 +17,17 @@ from driver.agent_health_heartbeat import (
     add_error_to_global,
     send_heartbeat,
 )
-from driver.driver_config_builder import DriverConfigBuilder, Overrides
+from driver.driver_config import DriverConfig
+from driver.driver_config_builder import (
+    MIN_AGENT_HEALTH_REPORT_INTERVAL,
+    MIN_LONG_RUNNING_QUERY_MONITOR_INTERVAL,
+    MIN_MONITOR_INTERVAL,
+    MIN_QUERY_MONITOR_INTERVAL,
+    MIN_SCHEMA_MONITOR_INTERVAL,
+    MIN_TABLE_LEVEL_MONITOR_INTERVAL,
+    DriverConfigBuilder,
+    Overrides,
+)
 from driver.pipeline import (
     SCHEMA_MONITOR_JOB_ID,
     schedule_or_update_job,
@@ -27,11 +38,38 @@ from driver.pipeline import (
 )
 
 
-# Setup the scheduler that will poll for new configs and run the core pipeline
-scheduler = BlockingScheduler()
+LOG_LEVELS = {
+    name: getattr(logging, name)
+    for name in (
+        "CRITICAL",
+        "FATAL",
+        "ERROR",
+        "WARNING",
+        "WARN",
+        "INFO",
+        "DEBUG",
+        "NOTSET",
+    )
+}
 
 
-def _get_args() -> argparse.Namespace:
+def _interval_at_least(minimum: int) -> Callable[[str], int]:
+    """
+    Build an argparse type that parses an interval (in seconds) no shorter than minimum
+    """
+
+    def parse_interval(value: str) -> int:
+        interval = int(value)
+        if interval < minimum:
+            raise argparse.ArgumentTypeError(
+                f"interval must be at least {minimum} seconds, got {interval}"
+            )
+        return interval
+
+    return parse_interval
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Provide driver configuration")
     parser.add_argument(
         "--log-verbosity",
@@ -88,7 +126,7 @@ def _get_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--override-monitor-interval",
-        type=int,
+        type=_interval_at_least(MIN_MONITOR_INTERVAL),
         help="Override file setting for how often to collect new data (in seconds)",
     )
     parser.add_argument(
@@ -103,7 +141,7 @@ def _get_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--override-table-level-monitor-interval",
-        type=int,
+        type=_interval_at_least(MIN_TABLE_LEVEL_MONITOR_INTERVAL),
         help="Override file setting for how often to collect table level data (in seconds)",
     )
     parser.add_argument(
@@ -131,7 +169,7 @@ def _get_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--override-query-monitor-interval",
-        type=int,
+        type=_interval_at_least(MIN_QUERY_MONITOR_INTERVAL),
         help="Override file setting for how often to collect query data (in seconds)",
     )
     parser.add_argument(
@@ -147,7 +185,7 @@ def _get_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--override-schema-monitor-interval",
-        type=int,
+        type=_interval_at_least(MIN_SCHEMA_MONITOR_INTERVAL),
         help="Override file setting for how often to collect schema data (in seconds)",
     )
     parser.add_argument(
@@ -158,7 +196,7 @@ def _get_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--override-long-running-query-monitor-interval",
-        type=int,
+        type=_interval_at_least(MIN_LONG_RUNNING_QUERY_MONITOR_INTERVAL),
         help="Override file setting for how often to collect long running query data (in seconds)",
     )
     parser.add_argument(
@@ -178,55 +216,53 @@ def _get_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--agent-health-report-interval",
-        type=int,
+        type=_interval_at_least(MIN_AGENT_HEALTH_REPORT_INTERVAL),
         help="Interval (in seconds) to send agent health information to OtterTune.",
         default=60,
     )
 
-    return parser.parse_args()
-
+    return parser
 
-def schedule_db_level_monitor_job(config) -> None:
-    """
-    The outer polling loop for the driver
-    """
-    schedule_or_update_job(scheduler, config, DB_LEVEL_MONITOR_JOB_ID)
 
-
-def schedule_table_level_monitor_job(config) -> None:
-    """
-    The polling loop for table level statistics
-    """
-    schedule_or_update_job(scheduler, config, TABLE_LEVEL_MONITOR_JOB_ID)
+# The command line schema is static, build the parser once
+_PARSER = _build_parser()
 
 
-def schedule_long_running_query_monitor_job(config) -> None:
-    """
-    The polling loop for long running query monitor
-    """
-    schedule_or_update_job(scheduler, config, LONG_RUNNING_QUERY_MONITOR_JOB_ID)
-
-
-def schedule_query_monitor_job(config) -> None:
-    """
-    The polling loop for query monitoring
-    """
-    schedule_or_update_job(scheduler, config, QUERY_MONITOR_JOB_ID)
-
-
-def schedule_schema_monitor_job(config) -> None:
+def _get_args() -> argparse.Namespace:
+    return _PARSER.parse_args()
+
+
+# Monitor jobs with the predicate deciding whether the job is enabled for a config
+MONITOR_JOBS: List[Tuple[str, Callable[[DriverConfig], bool]]] = [
+    (DB_LEVEL_MONITOR_JOB_ID, lambda config: True),
+    (
+        TABLE_LEVEL_MONITOR_JOB_ID,
+        lambda config: not config.disable_table_level_stats
+        or not config.disable_index_stats,
+    ),
+    (
+        LONG_RUNNING_QUERY_MONITOR_JOB_ID,
+        lambda config: not config.disable_long_running_query_monitoring,
+    ),
+    (QUERY_MONITOR_JOB_ID, lambda config: not config.disable_query_monitoring),
+    (SCHEMA_MONITOR_JOB_ID, lambda config: not config.disable_schema_monitoring),
+]
+
+
+def schedule_monitor_jobs(scheduler: BlockingScheduler, config: DriverConfig) -> None:
     """
-    The polling loop for schema monitoring
+    Schedule the polling loops of all monitor jobs enabled in the config
     """
-    schedule_or_update_job(scheduler, config, SCHEMA_MONITOR_JOB_ID)
+    for job_id, is_enabled in MONITOR_JOBS:
+        if is_enabled(config):
+            schedule_or_update_job(scheduler, config, job_id)
 
 
-def get_essential_config(args):
+def get_overrides(args) -> Overrides:
     """
-    Get the essential config for error reporting
+    Get the runtime overrides supplied on the command line
     """
-    config_builder = DriverConfigBuilder(args.aws_region)
-    overrides = Overrides(
+    return Overrides(
         monitor_interval=args.override_monitor_interval,
         server_url=args.override_server_url,
         num_table_to_collect_stats=args.override_num_table_to_collect_stats,
@@ -240,6 +276,14 @@ def get_essential_config(args):
         agent_health_report_interval=args.agent_health_report_interval,
     )
 
+
+def get_essential_config(args):
+    """
+    Get the essential config for error reporting
+    """
+    config_builder = DriverConfigBuilder(args.aws_region)
+    overrides = get_overrides(args)
+
     config_builder.from_placeholder_data().from_file(args.config).from_command_line(
         args
     ).from_overrides(overrides)
@@ -254,27 +298,13 @@ def get_config(args):
     Build configuration from file, command line overrides, rds info,
     """
     config_builder = DriverConfigBuilder(args.aws_region)
-    overrides = Overrides(
-        monitor_interval=args.override_monitor_interval,
-        server_url=args.override_server_url,
-        num_table_to_collect_stats=args.override_num_table_to_collect_stats,
-        table_level_monitor_interval=args.override_table_level_monitor_interval,
-        num_index_to_collect_stats=args.override_num_index_to_collect_stats,
-        long_running_query_monitor_interval=args.override_long_running_query_monitor_interval,
-        lr_query_latency_threshold_min=args.override_lr_query_latency_threshold_min,
-        query_monitor_interval=args.override_query_monitor_interval,
-        num_query_to_collect=args.override_num_query_to_collect,
-        schema_monitor_interval=args.override_schema_monitor_interval,
-        agent_health_report_interval=args.agent_health_report_interval,
-    )
+    overrides = get_overrides(args)
 
     config_builder.from_file(args.config).from_overrides(overrides).from_rds(
         args.db_identifier
     ).from_cloudwatch_metrics(args.db_identifier).from_command_line(
         args
-    ).from_env_vars().from_overrides(
-        overrides
-    )
+    ).from_env_vars()
 
     config = config_builder.get_config()
 
@@ -289,8 +319,8 @@ def run() -> None:
     args = _get_args()
 
     loglevel = args.log_verbosity
-    numeric_level = getattr(logging, loglevel.upper(), None)
-    if not isinstance(numeric_level, int):
+    numeric_level = LOG_LEVELS.get(loglevel.upper())
+    if numeric_level is None:
         raise ValueError(f"Invalid log level: {loglevel}")
     logging.basicConfig(level=numeric_level)
 
@@ -305,15 +335,9 @@ def run() -> None:
     try:
         config = get_config(args)
 
-        schedule_db_level_monitor_job(config)
-        if not config.disable_table_level_stats or not config.disable_index_stats:
-            schedule_table_level_monitor_job(config)
-        if not config.disable_long_running_query_monitoring:
-            schedule_long_running_query_monitor_job(config)
-        if not config.disable_query_monitoring:
-            schedule_query_monitor_job(config)
-        if not config.disable_schema_monitoring:
-            schedule_schema_monitor_job(config)
+        # Setup the scheduler that will poll for new configs and run the core pipeline
+        scheduler = BlockingScheduler()
+        schedule_monitor_jobs(scheduler, config)
         scheduler.start()
     except Exception as exc:  # pylint: disable=broad-except
         logging.error("Initialization error: %s", exc)
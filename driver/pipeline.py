@@ -4,12 +4,14 @@ from datetime import datetime
 import logging
 
 import requests
-from requests import Session
 
 from apscheduler.schedulers.background import BlockingScheduler
 
 from driver.driver_config import DriverConfig
-from driver.compute_server_client import ComputeServerClient
+from driver.compute_server_client import (
+    ComputeServerClient,
+    get_compute_server_client,
+)
 from driver.agent_health_heartbeat import add_error_to_global
 from driver.exceptions import DriverException
 from driver.s3_client import S3Client, ObservationType
@@ -41,8 +43,8 @@ def driver_pipeline(
     try:
         logging.info("Running driver pipeline deployment!")
 
-        compute_server_client = ComputeServerClient(
-            config.server_url, Session(), config.api_key
+        compute_server_client = get_compute_server_client(
+            config.server_url, config.api_key
         )
         s3_client = S3Client(
             config.enable_s3,
@@ -298,7 +300,7 @@ def schedule_or_update_job(
         _start_job(scheduler=scheduler, config=config, job_id=job_id, interval=interval)
     else:
         old_config = job.args[0]
-        if old_config != config:
+        if old_config is not config and old_config != config:
             _update_job(
                 scheduler=scheduler,
                 old_config=old_config,
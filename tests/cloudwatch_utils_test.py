@@ -3,7 +3,8 @@ from datetime import datetime, timedelta
 from typing import Any, Dict
 from unittest.mock import MagicMock
 import pytest
-from driver.aws.cloudwatch import _get_metrics_from_cloudwatch
+from driver.aws.cloudwatch import MAX_QUERIES_PER_REQUEST, _get_metrics_from_cloudwatch
+from driver.aws.wrapper import AwsWrapper
 
 # pylint: disable=missing-class-docstring, invalid-name
 # pylint: disable=missing-function-docstring
@@ -107,3 +108,52 @@ def test_get_metrics(mock_cloudwatch_client: MagicMock) -> None:
         "ReplicaLag": 7890,
     }
     assert metrics == expected_data
+
+
+def test_cloudwatch_client_is_shared_per_region() -> None:
+    assert AwsWrapper.cloudwatch_client("us-east-2") is AwsWrapper.cloudwatch_client(
+        "us-east-2"
+    )
+    assert AwsWrapper.cloudwatch_client("us-east-2") is not AwsWrapper.cloudwatch_client(
+        "us-west-2"
+    )
+
+
+def test_get_metrics_follows_next_token() -> None:
+    responses = [
+        {
+            "MetricDataResults": [
+                {"Id": "id_WriteIOPS", "Values": [1234]},
+                {"Id": "id_CPUUtilization", "Values": []},
+            ],
+            "NextToken": "token",
+        },
+        {
+            "MetricDataResults": [
+                {"Id": "id_WriteIOPS", "Values": [2234]},
+                {"Id": "id_CPUUtilization", "Values": [5555]},
+            ],
+        },
+    ]
+    mock_client = MagicMock()
+    mock_client.get_metric_data = MagicMock(side_effect=responses)
+    metrics = _get_metrics_from_cloudwatch(
+        "db_id", "", mock_client, ["WriteIOPS", "CPUUtilization"], [], UTC_NOW
+    )
+    assert metrics == {"WriteIOPS": 1234, "CPUUtilization": 5555}
+    assert mock_client.get_metric_data.call_count == 2
+    assert mock_client.get_metric_data.call_args.kwargs["NextToken"] == "token"
+
+
+def test_get_metrics_batches_queries() -> None:
+    metric_names = [f"Metric{i}" for i in range(MAX_QUERIES_PER_REQUEST + 1)]
+    mock_client = MagicMock()
+    mock_client.get_metric_data = MagicMock(
+        return_value={"MetricDataResults": []}
+    )
+    _get_metrics_from_cloudwatch("db_id", "", mock_client, metric_names, [], UTC_NOW)
+    batch_sizes = [
+        len(call.kwargs["MetricDataQueries"])
+        for call in mock_client.get_metric_data.call_args_list
+    ]
+    assert batch_sizes == [MAX_QUERIES_PER_REQUEST, 1]
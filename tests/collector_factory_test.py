@@ -9,6 +9,7 @@ import mysql.connector.connection
 import psycopg2
 from driver.collector.collector_factory import (
     create_db_config_mysql,
+    get_db_password,
     get_mysql_version,
     get_postgres_version,
 )
@@ -87,6 +88,23 @@ def test_db_config_mysql_iam_auth() -> None:
         assert expected_db_conf == db_conf
 
 
+def test_get_db_password_generates_token_per_connection() -> None:
+    driver_conf: Dict[str, Any] = {
+        "db_host": "localhost",
+        "db_port": 3306,
+        "db_user": "test_user",
+        "aws_region": "us-east-1",
+        "enable_aws_iam_auth": True,
+    }
+    with patch(
+        "driver.collector.collector_factory.get_db_auth_token"
+    ) as mocked_db_auth_token:
+        mocked_db_auth_token.side_effect = ["auth_token_1", "auth_token_2"]
+        assert get_db_password(driver_conf) == "auth_token_1"
+        assert get_db_password(driver_conf) == "auth_token_2"
+    assert mocked_db_auth_token.call_count == 2
+
+
 def test_db_config_mysql_invalid() -> None:
     driver_conf: Dict[str, Any] = {
         "db_host": "localhost",
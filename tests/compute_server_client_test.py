@@ -1,6 +1,7 @@
 """
 Tests for the compute server client
 """
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 import pytest
 import responses
@@ -9,7 +10,7 @@ import requests
 from driver.exceptions import ComputeServerClientException
 
 # Code under test
-from driver.compute_server_client import ComputeServerClient
+from driver.compute_server_client import ComputeServerClient, get_compute_server_client
 
 # pylint: disable=missing-class-docstring
 # pylint: disable=missing-function-docstring
@@ -217,3 +218,25 @@ def test_post_agent_health_heartbeat_session_not_found(
     with pytest.raises(ComputeServerClientException) as ex:
         client.post_agent_health_heartbeat(test_data["agent_health"])
     assert "404" in str(ex.value)
+
+
+def test_get_compute_server_client_reuses_session() -> None:
+    client = get_compute_server_client("https://server_url:8000", "test_api_key")
+    assert client is get_compute_server_client(
+        "https://server_url:8000", "test_api_key"
+    )
+    assert client is not get_compute_server_client(
+        "https://server_url:8000", "other_api_key"
+    )
+
+
+def test_get_compute_server_client_per_thread() -> None:
+    client = get_compute_server_client("https://server_url:8000", "test_api_key")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_client = executor.submit(
+            get_compute_server_client, "https://server_url:8000", "test_api_key"
+        ).result()
+    assert other_client is not client
+    # sessions must not be shared between concurrently running jobs
+    # pylint: disable=protected-access
+    assert other_client._req_session is not client._req_session
@@ -3,17 +3,27 @@ Tests for the config builder
 """
 
 from typing import Dict, Any
+import argparse
+import os
 import tempfile
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from pydantic import ValidationError
 import pytest
+import yaml
 
+from driver.driver_config import DriverConfigFactory
 from driver.driver_config_builder import (
     PartialConfigFromFile,
     PartialConfigFromRDS,
     DriverConfigBuilder,
+    Overrides,
+    _load_metric_names,
+    _read_yaml_file,
+    _CLOUDWATCH_METRICS_DIR,
+    _CLOUDWATCH_METRICS_CLUSTER_DIR,
 )
+from driver.exceptions import DriverConfigException
 
 # pylint: disable=missing-class-docstring
 # pylint: disable=missing-function-docstring
@@ -145,6 +155,17 @@ def test_partial_config_from_file_missing_value(
     assert "server_url" in str(ex.value)
 
 
+def test_partial_config_from_file_invalid_metric_source(
+    test_config_data: Dict[str, Any]
+) -> None:
+    # metric sources must have a registered collector
+    test_data_from_file = test_config_data["file"]
+    test_data_from_file["metric_source"] = ["cloudwatch", "prometheus"]
+    with pytest.raises(ValidationError) as ex:
+        PartialConfigFromFile(**test_data_from_file)
+    assert "metric_source" in str(ex.value)
+
+
 # Test PartialConfigFromRDS
 def test_partial_config_from_rds_success(test_config_data: Dict[str, Any]) -> None:
     # rds config success: all key values intact
@@ -161,22 +182,13 @@ def test_partial_config_from_rds_success(test_config_data: Dict[str, Any]) -> No
     ]
 
 
-def test_partial_config_from_rds_invalid_type(test_config_data: Dict[str, Any]) -> None:
-    # wrong type db_version fetched from env, string is expected, but int found
-    test_data_from_rds = test_config_data["rds"]
-    test_data_from_rds["db_version"] = 10
-    with pytest.raises(ValidationError) as ex:
-        PartialConfigFromRDS(**test_data_from_rds)
-    assert "db_version" in str(ex.value)
-
-
 def test_partial_config_from_rds_missing_value(
     test_config_data: Dict[str, Any]
 ) -> None:
     # missing option db_non_default_parameters fetched from rds
     test_data_from_rds = test_config_data["rds"]
     test_data_from_rds.pop("db_non_default_parameters")
-    with pytest.raises(ValidationError) as ex:
+    with pytest.raises(TypeError) as ex:
         PartialConfigFromRDS(**test_data_from_rds)
     assert "db_non_default_parameters" in str(ex.value)
 
@@ -198,46 +210,59 @@ def test_create_driver_config_builder_invalid_yaml() -> None:
             config_builder.from_file(temp.name)
 
 
-def test_get_cloudwatch_metric_file_aurora_mysql56() -> None:
+def _builder_with_db(db_type: str, db_version: str) -> DriverConfigBuilder:
     config_builder = DriverConfigBuilder("us-east-2")
-    with patch("driver.driver_config_builder.get_db_version") as mocked_db_version:
-        with patch("driver.driver_config_builder.get_db_type") as mocked_db_type:
-            mocked_db_type.return_value = "aurora_mysql"
-            mocked_db_version.return_value = "5_6_mysql_aurora_1_22_2"
-            # pylint: disable=protected-access
-            file_path = config_builder._get_cloudwatch_metrics_file("")
-            assert file_path == (
-                ("./driver/config/cloudwatch_metrics_cluster/rds_aurora_mysql-5_6.json"),
-                ("./driver/config/cloudwatch_metrics/rds_aurora_mysql-5_6.json")
-            )
+    config_builder.config.update({"db_type": db_type, "db_version": db_version})
+    config_builder.has_determined_db_type = True
+    return config_builder
 
 
-def test_get_cloudwatch_metric_file_aurora_mysql57() -> None:
+def test_get_cloudwatch_metric_file_requires_db_type() -> None:
     config_builder = DriverConfigBuilder("us-east-2")
-    with patch("driver.driver_config_builder.get_db_version") as mocked_db_version:
-        with patch("driver.driver_config_builder.get_db_type") as mocked_db_type:
-            mocked_db_type.return_value = "aurora_mysql"
-            mocked_db_version.return_value = "5_7_mysql_aurora_2_10_1"
-            # pylint: disable=protected-access
-            file_path = config_builder._get_cloudwatch_metrics_file("")
-            assert file_path == (
-                ("./driver/config/cloudwatch_metrics_cluster/rds_aurora_mysql-5_7.json"),
-                ("./driver/config/cloudwatch_metrics/rds_aurora_mysql-5_7.json")
-            )
+    with pytest.raises(DriverConfigException):
+        # pylint: disable=protected-access
+        config_builder._get_cloudwatch_metrics_file()
+
+
+def test_get_cloudwatch_metric_file_aurora_mysql56() -> None:
+    config_builder = _builder_with_db("aurora_mysql", "5_6_mysql_aurora_1_22_2")
+    # pylint: disable=protected-access
+    file_path = config_builder._get_cloudwatch_metrics_file()
+    assert file_path == (
+        os.path.join(_CLOUDWATCH_METRICS_CLUSTER_DIR, "rds_aurora_mysql-5_6.json"),
+        os.path.join(_CLOUDWATCH_METRICS_DIR, "rds_aurora_mysql-5_6.json")
+    )
+
+
+def test_get_cloudwatch_metric_file_aurora_mysql57() -> None:
+    config_builder = _builder_with_db("aurora_mysql", "5_7_mysql_aurora_2_10_1")
+    # pylint: disable=protected-access
+    file_path = config_builder._get_cloudwatch_metrics_file()
+    assert file_path == (
+        os.path.join(_CLOUDWATCH_METRICS_CLUSTER_DIR, "rds_aurora_mysql-5_7.json"),
+        os.path.join(_CLOUDWATCH_METRICS_DIR, "rds_aurora_mysql-5_7.json")
+    )
 
 
 def test_get_cloudwatch_metric_file_aurora_postgres12() -> None:
-    config_builder = DriverConfigBuilder("us-east-2")
-    with patch("driver.driver_config_builder.get_db_version") as mocked_db_version:
-        with patch("driver.driver_config_builder.get_db_type") as mocked_db_type:
-            mocked_db_type.return_value = "aurora_postgresql"
-            mocked_db_version.return_value = "12_6"
-            # pylint: disable=protected-access
-            file_path = config_builder._get_cloudwatch_metrics_file("")
-            assert file_path == (
-                ("./driver/config/cloudwatch_metrics_cluster/rds_aurora_postgresql-12.json"),
-                ("./driver/config/cloudwatch_metrics/rds_aurora_postgresql-12.json"),
-            )
+    config_builder = _builder_with_db("aurora_postgresql", "12_6")
+    # pylint: disable=protected-access
+    file_path = config_builder._get_cloudwatch_metrics_file()
+    assert file_path == (
+        os.path.join(_CLOUDWATCH_METRICS_CLUSTER_DIR, "rds_aurora_postgresql-12.json"),
+        os.path.join(_CLOUDWATCH_METRICS_DIR, "rds_aurora_postgresql-12.json"),
+    )
+
+
+def test_partial_config_from_file_invalid_agent_health_report_interval(
+    test_config_data: Dict[str, Any]
+) -> None:
+    # heartbeats need a positive interval, the same bound the command line enforces
+    test_data_from_file = test_config_data["file"]
+    test_data_from_file["agent_health_report_interval"] = 0
+    with pytest.raises(ValidationError) as ex:
+        PartialConfigFromFile(**test_data_from_file)
+    assert "agent_health_report_interval" in str(ex.value)
 
 
 def test_partial_config_from_file_invalid_schema_interval(
@@ -249,3 +274,190 @@ def test_partial_config_from_file_invalid_schema_interval(
     with pytest.raises(ValidationError) as ex:
         PartialConfigFromFile(**test_data_from_file)
     assert "schema_monitor_interval" in str(ex.value)
+
+
+def test_load_metric_names_is_cached() -> None:
+    with tempfile.NamedTemporaryFile("w", suffix=".json") as temp:
+        temp.write('[{"name": "CPUUtilization"}, {"name": "FreeableMemory"}]')
+        temp.flush()
+        _load_metric_names.cache_clear()
+        metric_names = _load_metric_names(temp.name)
+        assert metric_names == ("CPUUtilization", "FreeableMemory")
+        assert _load_metric_names(temp.name) is metric_names
+        assert _load_metric_names.cache_info().hits == 1
+
+
+def test_from_rds_populates_config(test_config_data: Dict[str, Any]) -> None:
+    rds_data = test_config_data["rds"]
+    config_builder = DriverConfigBuilder("us-east-2")
+    with patch.multiple(
+        "driver.driver_config_builder",
+        get_db_cluster_identifier=lambda *_: rds_data["db_cluster_identifier"],
+        get_db_hostname=lambda *_: rds_data["db_host"],
+        get_db_port=lambda *_: rds_data["db_port"],
+        get_db_version=lambda *_: rds_data["db_version"],
+        get_db_type=lambda *_: rds_data["db_type"],
+        get_db_non_default_parameters=lambda *_: rds_data["db_non_default_parameters"],
+    ):
+        config_builder.from_rds("test_identifier")
+    assert config_builder.has_determined_db_type
+    for key, value in rds_data.items():
+        assert config_builder.config[key] == value
+
+
+def test_from_rds_describes_db_instance_once() -> None:
+    config_builder = DriverConfigBuilder("us-east-2")
+    rds_client = MagicMock()
+    rds_client.describe_db_instances.return_value = {
+        "DBInstances": [
+            {
+                "Endpoint": {"Address": "test_host", "Port": 5432},
+                "EngineVersion": "12.6",
+                "Engine": "aurora-postgresql",
+                "DBClusterIdentifier": "test_cluster_identifier",
+                "DBParameterGroups": [],
+            }
+        ]
+    }
+    config_builder.rds_client = rds_client
+    config_builder.from_rds("test_identifier")
+    # pylint: disable=protected-access
+    config_builder._get_cloudwatch_metrics_file()
+    rds_client.describe_db_instances.assert_called_once_with(
+        DBInstanceIdentifier="test_identifier"
+    )
+    assert config_builder.config["db_type"] == "aurora_postgresql"
+    assert config_builder.config["db_version"] == "12_6"
+
+
+def test_from_file_populates_config(test_config_data: Dict[str, Any]) -> None:
+    with tempfile.NamedTemporaryFile("w", suffix=".yaml") as temp:
+        yaml.safe_dump(test_config_data["file"], temp)
+        temp.flush()
+        config_builder = DriverConfigBuilder("us-east-2")
+        config_builder.from_file(temp.name)
+    assert config_builder.config["server_url"] == "test_server_url"
+    assert config_builder.config["monitor_interval"] == 60
+    assert config_builder.config["metric_source"] == ["cloudwatch"]
+    # options that are not part of PartialConfigFromFile are dropped
+    assert "db_host" not in config_builder.config
+
+
+def test_from_command_line_parses_boolean_flags() -> None:
+    args = argparse.Namespace(
+        aws_region="us-east-2",
+        enable_s3=None,
+        s3_bucket_name="test_bucket",
+        db_identifier="test_identifier",
+        db_username="test_user",
+        db_password=None,
+        api_key="test_api_key",
+        db_key="test_db_key",
+        organization_id="test_organization",
+        disable_table_level_stats="True",
+        disable_index_stats="false",
+        disable_long_running_query_monitoring="yes",
+        disable_query_monitoring="False",
+        disable_schema_monitoring="1",
+        enable_aws_iam_auth="TRUE",
+    )
+    config_builder = DriverConfigBuilder("us-east-2")
+    config_builder.from_command_line(args)
+    assert config_builder.config["enable_s3"] is False
+    assert config_builder.config["disable_table_level_stats"] is True
+    assert config_builder.config["disable_index_stats"] is False
+    assert config_builder.config["disable_long_running_query_monitoring"] is True
+    assert config_builder.config["disable_query_monitoring"] is False
+    assert config_builder.config["disable_schema_monitoring"] is True
+    assert config_builder.config["enable_aws_iam_auth"] is True
+    assert config_builder.config["db_password"] == ""
+
+
+@pytest.mark.parametrize(
+    "rds_db_type, db_version, expected_file_name",
+    [
+        ("postgres", "13_4", "rds_postgres-13.json"),
+        ("postgres", "9_6_22", "rds_postgres-9_6.json"),
+        ("mysql", "8_0_28", "rds_mysql-8_0.json"),
+        ("mysql", "5_7", "rds_mysql-5_7.json"),
+    ],
+)
+def test_get_cloudwatch_metric_file_rds(
+    rds_db_type: str, db_version: str, expected_file_name: str
+) -> None:
+    config_builder = _builder_with_db(rds_db_type, db_version)
+    # pylint: disable=protected-access
+    cluster_file_path, file_path = config_builder._get_cloudwatch_metrics_file()
+    assert cluster_file_path == os.path.join(
+        _CLOUDWATCH_METRICS_CLUSTER_DIR, expected_file_name
+    )
+    assert file_path == os.path.join(_CLOUDWATCH_METRICS_DIR, expected_file_name)
+
+
+def test_get_cloudwatch_metric_file_unsupported_db_type() -> None:
+    config_builder = _builder_with_db("mariadb", "10_6_8")
+    with pytest.raises(DriverConfigException):
+        # pylint: disable=protected-access
+        config_builder._get_cloudwatch_metrics_file()
+
+
+def test_from_overrides_skips_unset_values() -> None:
+    overrides = Overrides(
+        monitor_interval=120,
+        server_url=None,
+        num_table_to_collect_stats=None,
+        table_level_monitor_interval=None,
+        num_index_to_collect_stats=None,
+        long_running_query_monitor_interval=None,
+        lr_query_latency_threshold_min=None,
+        query_monitor_interval=None,
+        num_query_to_collect=None,
+        schema_monitor_interval=None,
+        agent_health_report_interval=60,
+    )
+    config_builder = DriverConfigBuilder("us-east-2")
+    config_builder.config.update({"monitor_interval": 60, "server_url": "test_url"})
+    config_builder.from_overrides(overrides)
+    assert config_builder.config == {
+        "monitor_interval": 120,
+        "server_url": "test_url",
+        "agent_health_report_interval": 60,
+    }
+
+
+def test_get_config_reports_missing_options() -> None:
+    config_builder = DriverConfigBuilder("us-east-2").from_placeholder_data()
+    with pytest.raises(DriverConfigException) as ex:
+        config_builder.get_config()
+    assert "server_url" in str(ex.value)
+    assert "db_port" not in str(ex.value)
+
+
+def test_get_config_ignores_extra_options() -> None:
+    config = DriverConfigFactory()
+    config_builder = DriverConfigBuilder("us-east-2")
+    config_builder.config.update(config._asdict(), unused_option=1)
+    assert config_builder.get_config() == config
+
+
+def test_builders_share_rds_client() -> None:
+    assert (
+        DriverConfigBuilder("us-east-2").rds_client
+        is DriverConfigBuilder("us-east-2").rds_client
+    )
+
+
+def test_read_yaml_file_reparses_modified_file() -> None:
+    with tempfile.NamedTemporaryFile("w", suffix=".yaml") as temp:
+        temp.write("monitor_interval: 60\n")
+        temp.flush()
+        first = _read_yaml_file(temp.name)
+        first["monitor_interval"] = 0
+        assert _read_yaml_file(temp.name) == {"monitor_interval": 60}
+
+        temp.write("query_monitor_interval: 3600\n")
+        temp.flush()
+        assert _read_yaml_file(temp.name) == {
+            "monitor_interval": 60,
+            "query_monitor_interval": 3600,
+        }
@@ -0,0 +1,107 @@
+"""Tests for the driver entrypoint"""
+
+import argparse
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from driver.driver_config import DriverConfigFactory
+from driver.main import (
+    LOG_LEVELS,
+    _build_parser,
+    _interval_at_least,
+    schedule_monitor_jobs,
+)
+from driver.pipeline import (
+    DB_LEVEL_MONITOR_JOB_ID,
+    LONG_RUNNING_QUERY_MONITOR_JOB_ID,
+    QUERY_MONITOR_JOB_ID,
+    SCHEMA_MONITOR_JOB_ID,
+    TABLE_LEVEL_MONITOR_JOB_ID,
+)
+
+# pylint: disable=missing-function-docstring
+
+
+def _scheduled_job_ids(**config_kwargs) -> list:
+    config = DriverConfigFactory(**config_kwargs)
+    with patch("driver.main.schedule_or_update_job") as mocked_schedule:
+        schedule_monitor_jobs(MagicMock(), config)
+    return [call.args[2] for call in mocked_schedule.call_args_list]
+
+
+def test_schedule_monitor_jobs_all_enabled() -> None:
+    assert _scheduled_job_ids(
+        disable_table_level_stats=False,
+        disable_index_stats=False,
+        disable_long_running_query_monitoring=False,
+        disable_query_monitoring=False,
+        disable_schema_monitoring=False,
+    ) == [
+        DB_LEVEL_MONITOR_JOB_ID,
+        TABLE_LEVEL_MONITOR_JOB_ID,
+        LONG_RUNNING_QUERY_MONITOR_JOB_ID,
+        QUERY_MONITOR_JOB_ID,
+        SCHEMA_MONITOR_JOB_ID,
+    ]
+
+
+def test_schedule_monitor_jobs_all_disabled() -> None:
+    assert _scheduled_job_ids(
+        disable_table_level_stats=True,
+        disable_index_stats=True,
+        disable_long_running_query_monitoring=True,
+        disable_query_monitoring=True,
+        disable_schema_monitoring=True,
+    ) == [DB_LEVEL_MONITOR_JOB_ID]
+
+
+def test_schedule_monitor_jobs_table_level_needs_either_stats() -> None:
+    assert TABLE_LEVEL_MONITOR_JOB_ID in _scheduled_job_ids(
+        disable_table_level_stats=True, disable_index_stats=False
+    )
+
+
+def test_interval_at_least_accepts_minimum() -> None:
+    parse_interval = _interval_at_least(60)
+    assert parse_interval("60") == 60
+    assert parse_interval("3600") == 3600
+
+
+def test_interval_at_least_rejects_shorter_interval() -> None:
+    with pytest.raises(argparse.ArgumentTypeError):
+        _interval_at_least(60)("0")
+
+
+_REQUIRED_ARGS = [
+    "--config=driver_config.yaml",
+    "--aws-region=us-east-2",
+    "--db-identifier=test_db",
+    "--db-username=test_user",
+    "--api-key=test_api_key",
+    "--db-key=test_db_key",
+    "--organization-id=test_organization",
+]
+
+
+def test_parser_accepts_override_interval() -> None:
+    args = _build_parser().parse_args(
+        _REQUIRED_ARGS + ["--override-monitor-interval", "120"]
+    )
+    assert args.override_monitor_interval == 120
+
+
+def test_parser_rejects_short_override_interval() -> None:
+    with pytest.raises(SystemExit):
+        _build_parser().parse_args(
+            _REQUIRED_ARGS + ["--override-monitor-interval", "1"]
+        )
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["CRITICAL", "FATAL", "ERROR", "WARNING", "WARN", "INFO", "DEBUG", "NOTSET"],
+)
+def test_log_levels_resolve_logging_level_names(name: str) -> None:
+    assert LOG_LEVELS[name] == getattr(logging, name)